@@ -51,6 +51,22 @@ class _Hasher(collections.defaultdict):
 _hasher = _Hasher()
 
 
+class _ComponentMapItemsView(collections.abc.ItemsView):
+    __slots__ = ()
+
+    # The underlying dict already stores (obj, val) tuples: iterate
+    # over them directly instead of re-hashing every key
+    def __iter__(self):
+        return iter(self._mapping._dict.values())
+
+
+class _ComponentMapValuesView(collections.abc.ValuesView):
+    __slots__ = ()
+
+    def __iter__(self):
+        return (val for obj, val in self._mapping._dict.values())
+
+
 class ComponentMap(AutoSlots.Mixin, collections.abc.MutableMapping):
     """
     This class is a replacement for dict that allows Pyomo
@@ -128,6 +144,15 @@ class ComponentMap(AutoSlots.Mixin, collections.abc.MutableMapping):
             return self._dict.update(args[0]._dict)
         return super().update(*args, **kwargs)
 
+    # The default items() / values() views look up every key (which
+    # requires recomputing the key hash); iterate over the stored
+    # (obj, val) tuples instead.
+    def items(self):
+        return _ComponentMapItemsView(self)
+
+    def values(self):
+        return _ComponentMapValuesView(self)
+
     # We want to avoid generating Pyomo expressions due to comparing the
     # keys, so look up each entry from other in this dict.
     def __eq__(self, other):
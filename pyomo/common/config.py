@@ -1759,15 +1759,17 @@ class ConfigBase(object):
             kwds['default'] = self.value() if default is NOTSET else default
             assert implicit is NOTSET
             assert implicit_domain is NOTSET
+        # Note: only call locals() once (it is surprisingly expensive)
+        args = locals()
         for field in fields:
             if type(field) is tuple:
                 field, attr = field
             else:
                 attr = '_' + field
-            if locals()[field] is NOTSET:
+            if args[field] is NOTSET:
                 kwds[field] = getattr(self, attr, NOTSET)
             else:
-                kwds[field] = locals()[field]
+                kwds[field] = args[field]
 
         # Initialize the new config object
         ans = self.__class__(**kwds)
@@ -49,6 +49,25 @@ class TestComponentMap(unittest.TestCase):
         self.assertIn((1, (2, m.v)), m.cm)
         self.assertNotIn((1, (2, m.v)), i.cm)
 
+    def test_items_values(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3])
+        cm = ComponentMap((v, i) for i, v in m.x.items())
+
+        self.assertEqual(list(cm.items()), [(m.x[1], 1), (m.x[2], 2), (m.x[3], 3)])
+        self.assertEqual(list(cm.values()), [1, 2, 3])
+        self.assertEqual(len(cm.items()), 3)
+        self.assertEqual(len(cm.values()), 3)
+        self.assertIn((m.x[2], 2), cm.items())
+        self.assertNotIn((m.x[2], 3), cm.items())
+        self.assertIn(3, cm.values())
+        self.assertNotIn(4, cm.values())
+
+        # The views are dynamic
+        items = cm.items()
+        del cm[m.x[1]]
+        self.assertEqual(list(items), [(m.x[2], 2), (m.x[3], 3)])
+
 
 class TestDefaultComponentMap(unittest.TestCase):
     def test_default_component_map(self):
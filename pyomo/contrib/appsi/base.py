@@ -602,8 +602,13 @@ class Solver(abc.ABC):
         LimitedLicense = 2
         NeedsCompiledExtension = -3
 
+        def __init__(self, value):
+            # Cache the truth value (this is evaluated on every legacy
+            # solve() / available() call)
+            self._is_available = self._value_ > 0
+
         def __bool__(self):
-            return self._value_ > 0
+            return self._is_available
 
         def __format__(self, format_spec):
             # We want general formatting of this Enum to return the
@@ -1495,6 +1500,14 @@ legacy_solution_status_map = {
 }
 
 
+# The legacy solver information derived from the termination condition:
+# (solver status, termination condition, termination message)
+legacy_status_map = {
+    tc: (legacy_solver_status_map[tc], legacy_termination_condition_map[tc], str(tc))
+    for tc in legacy_termination_condition_map
+}
+
+
 class LegacySolverInterface(object):
     def solve(
         self,
@@ -1513,23 +1526,25 @@ class LegacySolverInterface(object):
     ):
         original_config = self.config
         self.config = self.config()
-        self.config.stream_solver = tee
-        self.config.load_solution = load_solutions
-        self.config.symbolic_solver_labels = symbolic_solver_labels
-        self.config.time_limit = timelimit
-        self.config.report_timing = report_timing
+        # Note: self.config is usually a property; only look it up once
+        config = self.config
+        config.stream_solver = tee
+        config.load_solution = load_solutions
+        config.symbolic_solver_labels = symbolic_solver_labels
+        config.time_limit = timelimit
+        config.report_timing = report_timing
         if solver_io is not None:
             raise NotImplementedError('Still working on this')
         if suffixes is not None:
             raise NotImplementedError('Still working on this')
         if logfile is not None:
             raise NotImplementedError('Still working on this')
-        if 'keepfiles' in self.config:
-            self.config.keepfiles = keepfiles
+        if 'keepfiles' in config:
+            config.keepfiles = keepfiles
         if solnfile is not None:
-            if 'filename' in self.config:
+            if 'filename' in config:
                 filename = os.path.splitext(solnfile)[0]
-                self.config.filename = filename
+                config.filename = filename
         original_options = self.options
         if options is not None:
             self.options = options
@@ -1537,15 +1552,11 @@ class LegacySolverInterface(object):
         results: Results = super(LegacySolverInterface, self).solve(model)
 
         legacy_results = LegacySolverResults()
-        legacy_soln = LegacySolution()
-        legacy_results.solver.status = legacy_solver_status_map[
-            results.termination_condition
-        ]
-        legacy_results.solver.termination_condition = legacy_termination_condition_map[
-            results.termination_condition
-        ]
-        legacy_soln.status = legacy_solution_status_map[results.termination_condition]
-        legacy_results.solver.termination_message = str(results.termination_condition)
+        (
+            legacy_results.solver.status,
+            legacy_results.solver.termination_condition,
+            legacy_results.solver.termination_message,
+        ) = legacy_status_map[results.termination_condition]
 
         obj = get_objective(model)
         legacy_results.problem.sense = obj.sense
@@ -1556,54 +1567,64 @@ class LegacySolverInterface(object):
         else:
             legacy_results.problem.upper_bound = results.best_objective_bound
             legacy_results.problem.lower_bound = results.best_feasible_objective
-        if (
-            results.best_feasible_objective is not None
-            and results.best_objective_bound is not None
-        ):
-            legacy_soln.gap = abs(
-                results.best_feasible_objective - results.best_objective_bound
-            )
-        else:
-            legacy_soln.gap = None
 
-        symbol_map = SymbolMap()
-        symbol_map.byObject = dict(self.symbol_map.byObject)
-        symbol_map.bySymbol = dict(self.symbol_map.bySymbol)
-        symbol_map.aliases = dict(self.symbol_map.aliases)
-        symbol_map.default_labeler = self.symbol_map.default_labeler
+        # Snapshot the solver's symbol map (the solver may relabel
+        # components on subsequent solves)
+        symbol_map = SymbolMap(self.symbol_map.default_labeler)
+        symbol_map.byObject = self.symbol_map.byObject.copy()
+        symbol_map.bySymbol = self.symbol_map.bySymbol.copy()
+        symbol_map.aliases = self.symbol_map.aliases.copy()
         model.solutions.add_symbol_map(symbol_map)
         legacy_results._smap_id = id(symbol_map)
 
-        delete_legacy_soln = True
+        # Determine which suffixes to import once
+        import_duals = hasattr(model, 'dual') and model.dual.import_enabled()
+        import_slacks = hasattr(model, 'slack') and model.slack.import_enabled()
+        import_rcs = hasattr(model, 'rc') and model.rc.import_enabled()
+
+        # Always report the (possibly empty) solution section
+        legacy_results.solution.activate()
         if load_solutions:
-            if hasattr(model, 'dual') and model.dual.import_enabled():
-                for c, val in results.solution_loader.get_duals().items():
-                    model.dual[c] = val
-            if hasattr(model, 'slack') and model.slack.import_enabled():
-                for c, val in results.solution_loader.get_slacks().items():
-                    model.slack[c] = val
-            if hasattr(model, 'rc') and model.rc.import_enabled():
-                for v, val in results.solution_loader.get_reduced_costs().items():
-                    model.rc[v] = val
+            if import_duals:
+                model.dual.update(results.solution_loader.get_duals())
+            if import_slacks:
+                model.slack.update(results.solution_loader.get_slacks())
+            if import_rcs:
+                model.rc.update(results.solution_loader.get_reduced_costs())
         elif results.best_feasible_objective is not None:
-            delete_legacy_soln = False
+            # The legacy solution is only reported when the solution is
+            # not loaded into the model
+            legacy_soln = LegacySolution()
+            legacy_soln.status = legacy_solution_status_map[
+                results.termination_condition
+            ]
+            if results.best_objective_bound is not None:
+                legacy_soln.gap = abs(
+                    results.best_feasible_objective - results.best_objective_bound
+                )
+            else:
+                legacy_soln.gap = None
+            if import_rcs:
+                rcs = results.solution_loader.get_reduced_costs()
+            else:
+                rcs = None
             for v, val in results.solution_loader.get_primals().items():
-                legacy_soln.variable[symbol_map.getSymbol(v)] = {'Value': val}
-            if hasattr(model, 'dual') and model.dual.import_enabled():
+                if rcs is None:
+                    legacy_soln.variable[symbol_map.getSymbol(v)] = {'Value': val}
+                else:
+                    legacy_soln.variable[symbol_map.getSymbol(v)] = {
+                        'Value': val,
+                        'Rc': rcs.get(v),
+                    }
+            if import_duals:
                 for c, val in results.solution_loader.get_duals().items():
                     legacy_soln.constraint[symbol_map.getSymbol(c)] = {'Dual': val}
-            if hasattr(model, 'slack') and model.slack.import_enabled():
+            if import_slacks:
                 for c, val in results.solution_loader.get_slacks().items():
                     symbol = symbol_map.getSymbol(c)
                     if symbol in legacy_soln.constraint:
                         legacy_soln.constraint[symbol]['Slack'] = val
-            if hasattr(model, 'rc') and model.rc.import_enabled():
-                for v, val in results.solution_loader.get_reduced_costs().items():
-                    legacy_soln.variable['Rc'] = val
-
-        legacy_results.solution.insert(legacy_soln)
-        if delete_legacy_soln:
-            legacy_results.solution.delete(0)
+            legacy_results.solution.insert(legacy_soln)
 
         self.config = original_config
         self.options = original_options
@@ -1612,9 +1633,10 @@ class LegacySolverInterface(object):
 
     def available(self, exception_flag=True):
         ans = super(LegacySolverInterface, self).available()
-        if exception_flag and not ans:
+        is_available = bool(ans)
+        if exception_flag and not is_available:
             raise ApplicationError(f'Solver {self.__class__} is not available ({ans}).')
-        return bool(ans)
+        return is_available
 
     def license_is_valid(self) -> bool:
         """Test if the solver license is valid on this system.
@@ -1632,22 +1654,30 @@ class LegacySolverInterface(object):
         """
         return bool(self.available())
 
+    # Names of the solver-specific options attributes (determined on
+    # first use; see _get_options_attrs())
+    _options_attrs = None
+
+    def _get_options_attrs(self):
+        if self._options_attrs is None:
+            attrs = tuple(
+                name + '_options'
+                for name in ('gurobi', 'ipopt', 'cplex', 'cbc', 'highs', 'maingo')
+                if hasattr(self, name + '_options')
+            )
+            if not attrs:
+                raise NotImplementedError('Could not find the correct options')
+            self._options_attrs = attrs
+        return self._options_attrs
+
     @property
     def options(self):
-        for solver_name in ['gurobi', 'ipopt', 'cplex', 'cbc', 'highs', 'maingo']:
-            if hasattr(self, solver_name + '_options'):
-                return getattr(self, solver_name + '_options')
-        raise NotImplementedError('Could not find the correct options')
+        return getattr(self, self._get_options_attrs()[0])
 
     @options.setter
     def options(self, val):
-        found = False
-        for solver_name in ['gurobi', 'ipopt', 'cplex', 'cbc', 'highs', 'maingo']:
-            if hasattr(self, solver_name + '_options'):
-                setattr(self, solver_name + '_options', val)
-                found = True
-        if not found:
-            raise NotImplementedError('Could not find the correct options')
+        for attr in self._get_options_attrs():
+            setattr(self, attr, val)
 
     def __enter__(self):
         return self
@@ -13,6 +13,9 @@ from pyomo.common import unittest
 from pyomo.contrib import appsi
 import pyomo.environ as pe
 from pyomo.core.base.var import ScalarVar
+from pyomo.core.base.label import NumericLabeler
+from pyomo.core.base.symbol_map import SymbolMap
+from pyomo.opt import TerminationCondition as LegacyTerminationCondition
 
 
 class TestResults(unittest.TestCase):
@@ -100,3 +103,95 @@ class TestResults(unittest.TestCase):
         slacks2 = res.solution_loader.get_slacks([m.c2])
         self.assertNotIn(m.c1, slacks2)
         self.assertAlmostEqual(slacks[m.c2], slacks2[m.c2])
+
+
+class _StubSolver(appsi.base.Solver):
+    def __init__(self, results):
+        self._results = results
+        self._config = appsi.base.SolverConfig()
+        self._symbol_map = SymbolMap(NumericLabeler('x'))
+        self.gurobi_options = {}
+
+    def solve(self, model, timer=None):
+        return self._results
+
+    def available(self):
+        return self.Availability.FullLicense
+
+    def version(self):
+        return (1, 0, 0)
+
+    @property
+    def config(self):
+        return self._config
+
+    @config.setter
+    def config(self, val):
+        self._config = val
+
+    @property
+    def symbol_map(self):
+        return self._symbol_map
+
+
+class _LegacyStubSolver(appsi.base.LegacySolverInterface, _StubSolver):
+    pass
+
+
+class TestLegacySolverInterface(unittest.TestCase):
+    def test_solve_without_loading_solutions(self):
+        m = pe.ConcreteModel()
+        m.x = pe.Var()
+        m.y = pe.Var()
+        m.c1 = pe.Constraint(expr=m.x + m.y >= 1)
+        m.c2 = pe.Constraint(expr=m.x - m.y <= 2)
+        m.obj = pe.Objective(expr=m.x + 2 * m.y)
+        m.dual = pe.Suffix(direction=pe.Suffix.IMPORT)
+        m.slack = pe.Suffix(direction=pe.Suffix.IMPORT)
+        m.rc = pe.Suffix(direction=pe.Suffix.IMPORT)
+
+        res = appsi.base.Results()
+        res.termination_condition = appsi.base.TerminationCondition.optimal
+        res.best_feasible_objective = 5
+        res.best_objective_bound = 4
+        res.solution_loader = appsi.base.SolutionLoader(
+            primals={id(m.x): (m.x, 1), id(m.y): (m.y, 2)},
+            duals={m.c1: 3, m.c2: 4},
+            slacks={m.c1: 7, m.c2: 8},
+            reduced_costs={id(m.x): (m.x, 5), id(m.y): (m.y, 6)},
+        )
+
+        opt = _LegacyStubSolver(res)
+        legacy_results = opt.solve(m, load_solutions=False)
+        self.assertEqual(
+            legacy_results.solver.termination_condition,
+            LegacyTerminationCondition.optimal,
+        )
+        self.assertEqual(
+            legacy_results.solver.termination_message, 'TerminationCondition.optimal'
+        )
+        # Nothing was loaded into the model
+        self.assertIsNone(m.x.value)
+        self.assertIsNone(m.y.value)
+        self.assertEqual(len(m.dual), 0)
+        self.assertEqual(len(m.slack), 0)
+        self.assertEqual(len(m.rc), 0)
+
+        self.assertEqual(len(legacy_results.solution), 1)
+        soln = legacy_results.solution(0)
+        self.assertEqual(soln.gap, 1)
+        self.assertEqual(
+            dict(soln.variable),
+            {'x1': {'Value': 1, 'Rc': 5}, 'x2': {'Value': 2, 'Rc': 6}},
+        )
+        self.assertEqual(
+            dict(soln.constraint),
+            {'x3': {'Dual': 3, 'Slack': 7}, 'x4': {'Dual': 4, 'Slack': 8}},
+        )
+        # The results can be reported
+        self.assertIn('number of solutions: 1', str(legacy_results))
+
+        # ... and loaded into the model
+        m.solutions.load_from(legacy_results)
+        self.assertEqual(m.x.value, 1)
+        self.assertEqual(m.y.value, 2)
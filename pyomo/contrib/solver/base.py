@@ -30,12 +30,10 @@ from pyomo.core.base import SymbolMap
 from pyomo.core.base.label import NumericLabeler
 from pyomo.core.staleflag import StaleFlagManager
 from pyomo.contrib.solver.config import SolverConfig, PersistentSolverConfig
-from pyomo.contrib.solver.util import get_objective
 from pyomo.contrib.solver.results import (
     Results,
-    legacy_solver_status_map,
-    legacy_termination_condition_map,
     legacy_solution_status_map,
+    legacy_status_map,
 )
 
 
@@ -467,25 +465,24 @@ class LegacySolverWrapper:
         """Map between legacy and new Results objects"""
         legacy_results = LegacySolverResults()
         legacy_soln = LegacySolution()
-        legacy_results.solver.status = legacy_solver_status_map[
-            results.termination_condition
-        ]
-        legacy_results.solver.termination_condition = legacy_termination_condition_map[
-            results.termination_condition
-        ]
+        (
+            legacy_results.solver.status,
+            legacy_results.solver.termination_condition,
+            legacy_results.solver.termination_message,
+        ) = legacy_status_map[results.termination_condition]
         legacy_soln.status = legacy_solution_status_map[results.solution_status]
-        legacy_results.solver.termination_message = str(results.termination_condition)
         legacy_results.problem.number_of_constraints = float('nan')
         legacy_results.problem.number_of_variables = float('nan')
-        number_of_objectives = sum(
-            1
-            for _ in model.component_data_objects(
-                Objective, active=True, descend_into=True
-            )
+        # Collect the active objectives in a single pass (instead of
+        # counting them and then searching the model again for the
+        # objective when there is only one)
+        objectives = list(
+            model.component_data_objects(Objective, active=True, descend_into=True)
         )
+        number_of_objectives = len(objectives)
         legacy_results.problem.number_of_objectives = number_of_objectives
         if number_of_objectives == 1:
-            obj = get_objective(model)
+            obj = objectives[0]
             legacy_results.problem.sense = obj.sense
 
             if obj.sense == minimize:
@@ -507,8 +504,7 @@ class LegacySolverWrapper:
         self, load_solutions, model, results, legacy_results, legacy_soln
     ):
         """Method to handle the preferred action for the solution"""
-        symbol_map = SymbolMap()
-        symbol_map.default_labeler = NumericLabeler('x')
+        symbol_map = SymbolMap(NumericLabeler('x'))
         if not hasattr(model, 'solutions'):
             # This logic gets around Issue #2130 in which
             # solutions is not an attribute on Blocks
@@ -517,32 +513,37 @@ class LegacySolverWrapper:
             setattr(model, 'solutions', ModelSolutions(model))
         model.solutions.add_symbol_map(symbol_map)
         legacy_results._smap_id = id(symbol_map)
-        delete_legacy_soln = True
+        # Always report the (possibly empty) solution section
+        legacy_results.solution.activate()
         if load_solutions:
             if hasattr(model, 'dual') and model.dual.import_enabled():
-                for c, val in results.solution_loader.get_duals().items():
-                    model.dual[c] = val
+                model.dual.update(results.solution_loader.get_duals())
             if hasattr(model, 'rc') and model.rc.import_enabled():
-                for v, val in results.solution_loader.get_reduced_costs().items():
-                    model.rc[v] = val
+                model.rc.update(results.solution_loader.get_reduced_costs())
         elif results.incumbent_objective is not None:
-            delete_legacy_soln = False
+            # The legacy solution is only reported when the solution is
+            # not loaded into the model
+            if hasattr(model, 'rc') and model.rc.import_enabled():
+                rcs = results.solution_loader.get_reduced_costs()
+            else:
+                rcs = None
             for v, val in results.solution_loader.get_primals().items():
-                legacy_soln.variable[symbol_map.getSymbol(v)] = {'Value': val}
+                if rcs is None:
+                    legacy_soln.variable[symbol_map.getSymbol(v)] = {'Value': val}
+                else:
+                    legacy_soln.variable[symbol_map.getSymbol(v)] = {
+                        'Value': val,
+                        'Rc': rcs.get(v),
+                    }
             if hasattr(model, 'dual') and model.dual.import_enabled():
                 for c, val in results.solution_loader.get_duals().items():
                     legacy_soln.constraint[symbol_map.getSymbol(c)] = {'Dual': val}
-            if hasattr(model, 'rc') and model.rc.import_enabled():
-                for v, val in results.solution_loader.get_reduced_costs().items():
-                    legacy_soln.variable['Rc'] = val
+            legacy_results.solution.insert(legacy_soln)
 
-        legacy_results.solution.insert(legacy_soln)
         # Timing info was not originally on the legacy results, but we want
         # to make it accessible to folks who are utilizing the backwards
         # compatible version.
         legacy_results.timing_info = results.timing_info
-        if delete_legacy_soln:
-            legacy_results.solution.delete(0)
         return legacy_results
 
     def solve(
@@ -614,12 +615,13 @@ class LegacySolverWrapper:
         on the system.
         """
         ans = super().available()
-        if exception_flag and not ans:
+        is_available = bool(ans)
+        if exception_flag and not is_available:
             raise ApplicationError(
                 f'Solver "{self.name}" is not available. '
                 f'The returned status is: {ans}.'
             )
-        return bool(ans)
+        return is_available
 
     def license_is_valid(self) -> bool:
         """Test if the solver license is valid on this system.
@@ -351,3 +351,11 @@ legacy_solution_status_map = {
     SolutionStatus.feasible: LegacySolutionStatus.feasible,
     SolutionStatus.feasible: LegacySolutionStatus.bestSoFar,
 }
+
+
+# The legacy solver information derived from the termination condition:
+# (solver status, termination condition, termination message)
+legacy_status_map = {
+    tc: (legacy_solver_status_map[tc], legacy_termination_condition_map[tc], str(tc))
+    for tc in legacy_termination_condition_map
+}
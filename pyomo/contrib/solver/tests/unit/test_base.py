@@ -12,8 +12,12 @@
 import os
 
 from pyomo.common import unittest
+from pyomo.common.collections import ComponentMap
 from pyomo.common.config import ConfigDict
 from pyomo.contrib.solver import base
+from pyomo.contrib.solver.results import Results
+from pyomo.contrib.solver.solution import SolutionLoaderBase
+from pyomo.environ import ConcreteModel, Constraint, Objective, Suffix, Var
 
 
 class _LegacyWrappedSolverBase(base.LegacySolverWrapper, base.SolverBase):
@@ -358,6 +362,65 @@ class TestLegacySolverWrapper(unittest.TestCase):
         # Unclear how to test this
         pass
 
+    @unittest.mock.patch.multiple(_LegacyWrappedSolverBase, __abstractmethods__=set())
     def test_solution_handler(self):
-        # Unclear how to test this
-        pass
+        class _Loader(SolutionLoaderBase):
+            def __init__(self, primals, duals, rcs):
+                self.primals, self.duals, self.rcs = primals, duals, rcs
+
+            def get_primals(self, vars_to_load=None):
+                return ComponentMap(self.primals)
+
+            def get_duals(self, cons_to_load=None):
+                return ComponentMap(self.duals)
+
+            def get_reduced_costs(self, vars_to_load=None):
+                return ComponentMap(self.rcs)
+
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.c = Constraint(expr=m.x + m.y >= 1)
+        m.o = Objective(expr=m.x)
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        m.rc = Suffix(direction=Suffix.IMPORT)
+
+        results = Results()
+        results.incumbent_objective = 1
+        results.solution_loader = _Loader(
+            [(m.x, 1), (m.y, 0)], [(m.c, 2)], [(m.x, 0), (m.y, 3)]
+        )
+        solver = _LegacyWrappedSolverBase()
+        legacy_results, legacy_soln = solver._map_results(m, results)
+        legacy_results = solver._solution_handler(
+            False, m, results, legacy_results, legacy_soln
+        )
+        self.assertEqual(len(legacy_results.solution), 1)
+        soln = legacy_results.solution(0)
+        self.assertEqual(
+            dict(soln.variable),
+            {'x1': {'Value': 1, 'Rc': 0}, 'x2': {'Value': 0, 'Rc': 3}},
+        )
+        self.assertEqual(dict(soln.constraint), {'x3': {'Dual': 2}})
+        # Nothing was loaded into the model
+        self.assertEqual(len(m.dual), 0)
+        self.assertEqual(len(m.rc), 0)
+
+        legacy_results, legacy_soln = solver._map_results(m, results)
+        legacy_results = solver._solution_handler(
+            True, m, results, legacy_results, legacy_soln
+        )
+        self.assertEqual(len(legacy_results.solution), 0)
+        self.assertEqual(list(m.dual.items()), [(m.c, 2)])
+        self.assertEqual(list(m.rc.items()), [(m.x, 0), (m.y, 3)])
+
+        results.solution_loader = _Loader([(m.x, 1), (m.y, 0)], [], [])
+        m.del_component(m.dual)
+        m.del_component(m.rc)
+        legacy_results, legacy_soln = solver._map_results(m, results)
+        legacy_results = solver._solution_handler(
+            False, m, results, legacy_results, legacy_soln
+        )
+        soln = legacy_results.solution(0)
+        self.assertEqual(dict(soln.variable), {'x1': {'Value': 1}, 'x2': {'Value': 0}})
+        self.assertEqual(dict(soln.constraint), {})
@@ -202,6 +202,10 @@ class ListContainer(object):
             self.add()
         setattr(self._list[0], name, val)
 
+    def activate(self):
+        # Report this (possibly empty) list when the results are printed
+        self._active = True
+
     def insert(self, obj):
         self._active = True
         self._list.append(obj)
@@ -141,6 +141,14 @@ class Test(unittest.TestCase):
         )
         self.assertTrue(cmp(_out, _log), msg="Files %s and %s differ" % (_out, _log))
 
+    def test_activate_empty_solution_set(self):
+        """Report an empty solution set"""
+        results = pyomo.opt.SolverResults()
+        self.assertNotIn('Solution', str(results))
+        results.solution.activate()
+        self.assertEqual(len(results.solution), 0)
+        self.assertIn('Solution: \n- number of solutions: 0', str(results))
+
     def test_get_solution(self):
         """Get a solution from a SolverResults object"""
         tmp = self.results.solution[0]
@@ -11,7 +11,7 @@
 
 import collections
 import logging
-from operator import attrgetter
+from operator import attrgetter, itemgetter, neg
 
 from pyomo.common.config import (
     ConfigBlock,
@@ -129,6 +129,42 @@ class LinearStandardFormInfo(object):
         return self.rhs
 
 
+class _ArrayBuffer(object):
+    """Incrementally convert a Python list into a NumPy array
+
+    Values are accumulated in a (fast to extend) Python list that is
+    periodically flushed into a NumPy buffer whose capacity doubles as
+    needed.  This avoids allocating small arrays for every row while
+    bounding the number of Python objects that are kept alive.
+
+    """
+
+    # Number of list entries to accumulate before flushing
+    flush_size = 1 << 16
+
+    def __init__(self, values, dtype):
+        self.values = values
+        self.data = np.empty(self.flush_size, dtype=dtype)
+        self.size = 0
+
+    def flush(self):
+        values = self.values
+        end = self.size + len(values)
+        if end > len(self.data):
+            data = np.empty(max(end, 2 * len(self.data)), dtype=self.data.dtype)
+            data[: self.size] = self.data[: self.size]
+            self.data = data
+        self.data[self.size : end] = values
+        self.size = end
+        values.clear()
+
+    def finalize(self):
+        self.flush()
+        # Release the unused capacity
+        self.data.resize(self.size, refcheck=False)
+        return self.data
+
+
 @WriterFactory.register(
     'compile_standard_form', 'Compile an LP to standard form (`min cTx s.t. Ax <= b`)'
 )
@@ -291,7 +327,7 @@ class _LinearStandardFormCompiler_impl(object):
 
         self.var_map = var_map = {}
         initialize_var_map_from_column_order(model, self.config, var_map)
-        var_order = {_id: i for i, _id in enumerate(var_map)}
+        var_order = dict(zip(var_map, range(len(var_map))))
 
         visitor = LinearRepnVisitor({}, var_map, var_order, sorter)
 
@@ -333,8 +369,7 @@ class _LinearStandardFormCompiler_impl(object):
                 )
             )
         obj_offset = []
-        obj_data = []
-        obj_index = []
+        obj_linear = []
         obj_index_ptr = [0]
         for obj in objectives:
             repn = visitor.walk_expression(obj.expr)
@@ -343,18 +378,23 @@ class _LinearStandardFormCompiler_impl(object):
                     f"Model objective ({obj.name}) contains nonlinear terms that "
                     "cannot be compiled to standard (linear) form."
                 )
-            N = len(repn.linear)
-            obj_data.append(np.fromiter(repn.linear.values(), float, N))
-            obj_offset.append(repn.constant)
-            if set_sense is not None and set_sense != obj.sense:
-                obj_data[-1] *= -1
-                obj_offset[-1] *= -1
-            obj_index.append(
-                np.fromiter(map(var_order.__getitem__, repn.linear), float, N)
-            )
-            obj_index_ptr.append(obj_index_ptr[-1] + N)
+            flip = set_sense is not None and set_sense != obj.sense
+            obj_offset.append(-repn.constant if flip else repn.constant)
+            obj_linear.append((repn.linear, flip))
+            obj_index_ptr.append(obj_index_ptr[-1] + len(repn.linear))
             if with_debug_timing:
                 timer.toc('Objective %s', obj, level=logging.DEBUG)
+        # Now that the total number of nonzeros is known, fill
+        # preallocated arrays with the objective coefficients
+        obj_data = np.empty(obj_index_ptr[-1])
+        obj_index = np.empty(obj_index_ptr[-1], dtype=np.int32)
+        for i, (linear, flip) in enumerate(obj_linear):
+            start, end = obj_index_ptr[i : i + 2]
+            _data = obj_data[start:end]
+            _data[:] = list(linear.values())
+            if flip:
+                np.negative(_data, out=_data)
+            obj_index[start:end] = _column_indices(linear, var_order)
 
         #
         # Tabulate constraints
@@ -364,13 +404,86 @@ class _LinearStandardFormCompiler_impl(object):
         if slack_form and mixed_form:
             raise ValueError("cannot specify both slack_form and mixed_form")
         rows = []
-        rhs = []
-        con_data = []
-        con_index = []
-        con_index_ptr = [0]
+        # Row data is streamed into NumPy arrays as it is generated.
+        # Note that con_index is first, as it is the longest list (and
+        # determines when the buffers are flushed).  The number of
+        # nonzeros is not known yet, so the row pointers are int64.
+        buffers = (
+            _ArrayBuffer([], np.int32),
+            _ArrayBuffer([], np.float64),
+            _ArrayBuffer([0], np.int64),
+            _ArrayBuffer([], np.float64),
+        )
+        constraints = self._linear_constraints(
+            model, visitor, timer if with_debug_timing else None
+        )
+        # The form is constant for all constraints: select the
+        # specialized tabulation loop once (instead of testing the
+        # form for every constraint)
+        if mixed_form:
+            tabulate = self._tabulate_mixed_form
+        elif slack_form:
+            tabulate = self._tabulate_slack_form
+        else:
+            tabulate = self._tabulate_default_form
+        tabulate(constraints, rows, buffers, var_order)
+
+        # Get the variable list
+        columns = list(var_map.values())
+        # Convert the compiled data to NumPy arrays with the dtypes that
+        # scipy uses natively (so it does not have to copy them)
+        obj_index_ptr = np.array(obj_index_ptr, dtype=_index_dtype(obj_index_ptr[-1]))
+        con_index, con_data, con_index_ptr, rhs = (b.finalize() for b in buffers)
+        con_index_ptr = con_index_ptr.astype(
+            _index_dtype(con_index_ptr[-1]), copy=False
+        )
+
+        # Some variables in the var_map may not actually appear in the
+        # objective or constraints (e.g., added from col_order, or
+        # multiplied by 0 in the expressions).  Identify the empty
+        # columns from the column indices before building the
+        # matrices, so we only construct the final (reduced) ones.
+        nCol = len(columns)
+        active_var_mask = np.zeros(nCol, dtype=bool)
+        active_var_mask[con_index] = True
+        active_var_mask[obj_index] = True
+
+        # In the common case every column is active and there is
+        # nothing to prune.  Otherwise, renumber the column indices.
+        if not active_var_mask.all():
+            columns = [v for k, v in zip(active_var_mask, columns) if k]
+            nCol = len(columns)
+            new_col = np.cumsum(active_var_mask, dtype=np.int32) - 1
+            obj_index = new_col[obj_index]
+            con_index = new_col[con_index]
+
+        c = _create_csc(obj_data, obj_index, obj_index_ptr, nCol)
+        A = _create_csc(con_data, con_index, con_index_ptr, nCol)
+
+        if self.config.nonnegative_vars:
+            c, A, columns, eliminated_vars = _csc_to_nonnegative_vars(c, A, columns)
+        else:
+            eliminated_vars = []
+
+        info = LinearStandardFormInfo(
+            c, np.array(obj_offset), A, rhs, rows, columns, objectives, eliminated_vars
+        )
+        timer.toc("Generated linear standard form representation", delta=False)
+        return info
+
+    def _linear_constraints(self, model, visitor, timer):
+        """Generate the compiled linear form of the active constraints
+
+        Yields (con, lb, ub, offset, linear) tuples.  Unbounded
+        constraints and (feasible) constraints without variables are
+        skipped.  `timer` is only provided when reporting the debug
+        timing for each constraint component.
+
+        """
+        walk_expression = visitor.walk_expression
         last_parent = None
         for con in ordered_active_constraints(model, self.config):
-            if with_debug_timing and con.parent_component() is not last_parent:
+            if timer is not None and con.parent_component() is not last_parent:
                 if last_parent is not None:
                     timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
                 last_parent = con.parent_component()
@@ -379,7 +492,7 @@ class _LinearStandardFormCompiler_impl(object):
             lb = con.lb
             ub = con.ub
 
-            repn = visitor.walk_expression(con.body)
+            repn = walk_expression(con.body)
 
             if lb is None and ub is None:
                 # Note: you *cannot* output trivial (unbounded)
@@ -396,200 +509,232 @@ class _LinearStandardFormCompiler_impl(object):
             offset = repn.constant
             repn.constant = 0
 
-            if not repn.linear:
+            linear = repn.linear
+            if not linear:
                 if (lb is None or lb <= offset) and (ub is None or ub >= offset):
                     continue
                 raise InfeasibleError(
                     f"model contains a trivially infeasible constraint, '{con.name}'"
                 )
+            yield con, lb, ub, offset, linear
 
-            if mixed_form:
-                N = len(repn.linear)
-                _data = np.fromiter(repn.linear.values(), float, N)
-                _index = np.fromiter(map(var_order.__getitem__, repn.linear), float, N)
-                if ub == lb:
-                    rows.append(RowEntry(con, 0))
-                    rhs.append(ub - offset)
-                    con_data.append(_data)
-                    con_index.append(_index)
-                    con_index_ptr.append(con_index_ptr[-1] + N)
-                else:
-                    if ub is not None:
-                        rows.append(RowEntry(con, 1))
-                        rhs.append(ub - offset)
-                        con_data.append(_data)
-                        con_index.append(_index)
-                        con_index_ptr.append(con_index_ptr[-1] + N)
-                    if lb is not None:
-                        rows.append(RowEntry(con, -1))
-                        rhs.append(lb - offset)
-                        con_data.append(_data)
-                        con_index.append(_index)
-                        con_index_ptr.append(con_index_ptr[-1] + N)
-            elif slack_form:
-                _data = list(repn.linear.values())
-                _index = list(map(var_order.__getitem__, repn.linear))
-                if lb == ub:  # TODO: add tolerance?
-                    rhs.append(ub - offset)
-                else:
-                    # add slack variable
-                    v = Var(name=f'_slack_{len(rhs)}', bounds=(None, None))
-                    v.construct()
-                    if lb is None:
-                        rhs.append(ub - offset)
-                        v.lb = 0
-                    else:
-                        rhs.append(lb - offset)
-                        v.ub = 0
-                        if ub is not None:
-                            v.lb = lb - ub
-                    var_map[id(v)] = v
-                    var_order[id(v)] = slack_col = len(var_order)
-                    _data.append(1)
-                    _index.append(slack_col)
-                rows.append(RowEntry(con, 1))
-                con_data.append(np.array(_data))
-                con_index.append(np.array(_index))
-                con_index_ptr.append(con_index_ptr[-1] + len(_index))
+        if timer is not None:
+            # report the last constraint
+            timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
+
+    def _tabulate_mixed_form(self, constraints, rows, buffers, var_order):
+        con_index, con_data, con_index_ptr, rhs = (buf.values for buf in buffers)
+        flush_size = _ArrayBuffer.flush_size
+        nnz = con_index_ptr[-1]
+        for con, lb, ub, offset, linear in constraints:
+            if len(con_index) >= flush_size:
+                for buf in buffers:
+                    buf.flush()
+            N = len(linear)
+            _data = linear.values()
+            _index = _column_indices(linear, var_order)
+            if ub == lb:
+                rows.append(RowEntry(con, 0))
+                rhs.append(ub - offset)
+                con_data.extend(_data)
+                con_index.extend(_index)
+                nnz += N
+                con_index_ptr.append(nnz)
             else:
-                N = len(repn.linear)
-                _data = np.fromiter(repn.linear.values(), float, N)
-                _index = np.fromiter(map(var_order.__getitem__, repn.linear), float, N)
                 if ub is not None:
                     rows.append(RowEntry(con, 1))
                     rhs.append(ub - offset)
-                    con_data.append(_data)
-                    con_index.append(_index)
-                    con_index_ptr.append(con_index_ptr[-1] + N)
+                    con_data.extend(_data)
+                    con_index.extend(_index)
+                    nnz += N
+                    con_index_ptr.append(nnz)
                 if lb is not None:
                     rows.append(RowEntry(con, -1))
-                    rhs.append(offset - lb)
-                    con_data.append(-_data)
-                    con_index.append(_index)
-                    con_index_ptr.append(con_index_ptr[-1] + N)
+                    rhs.append(lb - offset)
+                    con_data.extend(_data)
+                    con_index.extend(_index)
+                    nnz += N
+                    con_index_ptr.append(nnz)
+
+    def _tabulate_slack_form(self, constraints, rows, buffers, var_order):
+        con_index, con_data, con_index_ptr, rhs = (buf.values for buf in buffers)
+        flush_size = _ArrayBuffer.flush_size
+        var_map = self.var_map
+        nnz = con_index_ptr[-1]
+        for con, lb, ub, offset, linear in constraints:
+            if len(con_index) >= flush_size:
+                for buf in buffers:
+                    buf.flush()
+            con_data.extend(linear.values())
+            con_index.extend(_column_indices(linear, var_order))
+            N = len(linear)
+            if lb == ub:  # TODO: add tolerance?
+                rhs.append(ub - offset)
+            else:
+                # add slack variable
+                v = Var(name=f'_slack_{len(rows)}', bounds=(None, None))
+                v.construct()
+                if lb is None:
+                    rhs.append(ub - offset)
+                    v.lb = 0
+                else:
+                    rhs.append(lb - offset)
+                    v.ub = 0
+                    if ub is not None:
+                        v.lb = lb - ub
+                var_map[id(v)] = v
+                var_order[id(v)] = slack_col = len(var_order)
+                con_data.append(1)
+                con_index.append(slack_col)
+                N += 1
+            rows.append(RowEntry(con, 1))
+            nnz += N
+            con_index_ptr.append(nnz)
+
+    def _tabulate_default_form(self, constraints, rows, buffers, var_order):
+        con_index, con_data, con_index_ptr, rhs = (buf.values for buf in buffers)
+        flush_size = _ArrayBuffer.flush_size
+        nnz = con_index_ptr[-1]
+        for con, lb, ub, offset, linear in constraints:
+            if len(con_index) >= flush_size:
+                for buf in buffers:
+                    buf.flush()
+            N = len(linear)
+            _data = linear.values()
+            _index = _column_indices(linear, var_order)
+            if ub is not None:
+                rows.append(RowEntry(con, 1))
+                rhs.append(ub - offset)
+                con_data.extend(_data)
+                con_index.extend(_index)
+                nnz += N
+                con_index_ptr.append(nnz)
+            if lb is not None:
+                rows.append(RowEntry(con, -1))
+                rhs.append(offset - lb)
+                con_data.extend(map(neg, _data))
+                con_index.extend(_index)
+                nnz += N
+                con_index_ptr.append(nnz)
+
+
+def _column_indices(linear, var_order):
+    """Return the column indices for the variables in a linear repn"""
+    if len(linear) > 1:
+        # itemgetter performs all the var_order lookups in C
+        return itemgetter(*linear)(var_order)
+    # itemgetter() returns a scalar (not a tuple) for a single key
+    return [var_order[_id] for _id in linear]
+
+
+def _index_dtype(maxval):
+    """Return the (scipy) index dtype able to store `maxval`"""
+    if maxval > np.iinfo(np.int32).max:
+        return np.int64
+    return np.int32
+
+
+def _create_csc(data, index, index_ptr, nCol):
+    """Assemble a CSC matrix from the row-ordered (CSR) compiled data
+
+    As the nonzeros are generated in row order, the row indices within
+    each column of the converted matrix are sorted (and, as each row
+    references a column at most once, there are no duplicates), so the
+    result is flagged as being in canonical form.
 
-        if with_debug_timing:
-            # report the last constraint
-            timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
+    """
+    ans = scipy.sparse.csr_array(
+        (data, index, index_ptr), [len(index_ptr) - 1, nCol]
+    ).tocsc()
+    ans.has_canonical_format = True
+    return ans
 
-        # Get the variable list
-        columns = list(var_map.values())
-        # Convert the compiled data to scipy sparse matrices
-        if obj_data:
-            obj_data = np.concatenate(obj_data)
-            obj_index = np.concatenate(obj_index)
-        c = scipy.sparse.csr_array(
-            (obj_data, obj_index, obj_index_ptr), [len(obj_index_ptr) - 1, len(columns)]
-        ).tocsc()
-        if rows:
-            con_data = np.concatenate(con_data)
-            con_index = np.concatenate(con_index)
-        A = scipy.sparse.csr_array(
-            (con_data, con_index, con_index_ptr), [len(rows), len(columns)]
-        ).tocsc()
 
-        # Some variables in the var_map may not actually appear in the
-        # objective or constraints (e.g., added from col_order, or
-        # multiplied by 0 in the expressions).  The easiest way to check
-        # for empty columns is to convert from CSR to CSC and then look
-        # at the index pointer list (an O(num_var) operation).
-        c_ip = c.indptr
-        A_ip = A.indptr
-        active_var_mask = (A_ip[1:] > A_ip[:-1]) | (c_ip[1:] > c_ip[:-1])
-
-        # Masks on NumPy arrays are very fast.  Build the reduced A
-        # indptr and then check if we actually have to manipulate the
-        # columns
-        augmented_mask = np.concatenate((active_var_mask, [True]))
-        reduced_A_indptr = A.indptr[augmented_mask]
-        nCol = len(reduced_A_indptr) - 1
-        if nCol != len(columns):
-            columns = [v for k, v in zip(active_var_mask, columns) if k]
-            c = scipy.sparse.csc_array(
-                (c.data, c.indices, c.indptr[augmented_mask]), [c.shape[0], nCol]
-            )
-            # active_var_idx[-1] = len(columns)
-            A = scipy.sparse.csc_array(
-                (A.data, A.indices, reduced_A_indptr), [A.shape[0], nCol]
-            )
+def _canonical_csc(data, indices, indptr, shape):
+    """Create a CSC array from data already in canonical form
 
-        if self.config.nonnegative_vars:
-            c, A, columns, eliminated_vars = _csc_to_nonnegative_vars(c, A, columns)
-        else:
-            eliminated_vars = []
+    All the matrices assembled here have sorted row indices and no
+    duplicate entries within each column.  Recording that lets scipy
+    skip checking (or re-sorting) the indices in later operations.
 
-        info = LinearStandardFormInfo(
-            c, np.array(obj_offset), A, rhs, rows, columns, objectives, eliminated_vars
-        )
-        timer.toc("Generated linear standard form representation", delta=False)
-        return info
+    """
+    ans = scipy.sparse.csc_array((data, indices, indptr), shape)
+    ans.has_canonical_format = True
+    return ans
 
 
 def _csc_to_nonnegative_vars(c, A, columns):
+    bounds = [v.bounds for v in columns]
+    # None (unbounded) is converted to NaN
+    lb, ub = np.array(bounds, dtype=float).reshape(-1, 2).T
+    neg_mask, split_mask, c, A = _nonnegative_csc_kernel(c, A, lb, ub)
+
+    # Create the Pyomo variables for the new columns
     eliminated_vars = []
     new_columns = []
-    new_c_data = []
-    new_c_indices = []
-    new_c_indptr = [0]
-    new_A_data = []
-    new_A_indices = []
-    new_A_indptr = [0]
     for i, v in enumerate(columns):
-        lb, ub = v.bounds
-        if lb is None or lb < 0:
-            name = v.name
-            new_columns.append(
-                Var(
-                    name=f'_neg_{i}',
-                    domain=v.domain,
-                    bounds=(0, None if lb is None else -lb),
-                )
+        if not neg_mask[i]:  # lb >= 0
+            new_columns.append(v)
+            continue
+        lb, ub = bounds[i]
+        new_columns.append(
+            Var(
+                name=f'_neg_{i}',
+                domain=v.domain,
+                bounds=(0, None if lb is None else -lb),
             )
+        )
+        new_columns[-1].construct()
+        if split_mask[i]:
+            # Crosses 0; split into 2 vars
+            new_columns.append(Var(name=f'_pos_{i}', domain=v.domain, bounds=(0, ub)))
             new_columns[-1].construct()
-            s, e = A.indptr[i : i + 2]
-            new_A_data.append(-A.data[s:e])
-            new_A_indices.append(A.indices[s:e])
-            new_A_indptr.append(new_A_indptr[-1] + e - s)
-            s, e = c.indptr[i : i + 2]
-            new_c_data.append(-c.data[s:e])
-            new_c_indices.append(c.indices[s:e])
-            new_c_indptr.append(new_c_indptr[-1] + e - s)
-            if ub is None or ub > 0:
-                # Crosses 0; split into 2 vars
-                new_columns.append(
-                    Var(name=f'_pos_{i}', domain=v.domain, bounds=(0, ub))
-                )
-                new_columns[-1].construct()
-                s, e = A.indptr[i : i + 2]
-                new_A_data.append(A.data[s:e])
-                new_A_indices.append(A.indices[s:e])
-                new_A_indptr.append(new_A_indptr[-1] + e - s)
-                s, e = c.indptr[i : i + 2]
-                new_c_data.append(c.data[s:e])
-                new_c_indices.append(c.indices[s:e])
-                new_c_indptr.append(new_c_indptr[-1] + e - s)
-                eliminated_vars.append((v, new_columns[-1] - new_columns[-2]))
-            else:
-                new_columns[-1].lb = -ub
-                eliminated_vars.append((v, -new_columns[-1]))
-        else:  # lb >= 0
-            new_columns.append(v)
-            s, e = A.indptr[i : i + 2]
-            new_A_data.append(A.data[s:e])
-            new_A_indices.append(A.indices[s:e])
-            new_A_indptr.append(new_A_indptr[-1] + e - s)
-            s, e = c.indptr[i : i + 2]
-            new_c_data.append(c.data[s:e])
-            new_c_indices.append(c.indices[s:e])
-            new_c_indptr.append(new_c_indptr[-1] + e - s)
-
-    nCol = len(new_columns)
-    c = scipy.sparse.csc_array(
-        (np.concatenate(new_c_data), np.concatenate(new_c_indices), new_c_indptr),
-        [c.shape[0], nCol],
-    )
-    A = scipy.sparse.csc_array(
-        (np.concatenate(new_A_data), np.concatenate(new_A_indices), new_A_indptr),
-        [A.shape[0], nCol],
-    )
+            eliminated_vars.append((v, new_columns[-1] - new_columns[-2]))
+        else:
+            new_columns[-1].lb = -ub
+            eliminated_vars.append((v, -new_columns[-1]))
     return c, A, new_columns, eliminated_vars
+
+
+def _nonnegative_csc_kernel(c, A, lb, ub):
+    """Numeric core of :py:func:`_csc_to_nonnegative_vars`
+
+    `lb` and `ub` are float arrays of the column bounds (NaN if the
+    column is unbounded).  Columns that admit negative values are
+    replaced by a negated nonnegative column.  Columns that cross 0 are
+    split into two columns (a negated and a positive one).  Returns the
+    `neg_mask` and `split_mask` column masks and the transformed `c` and `A`.
+
+    """
+    # NaN compares False, so unbounded columns are in neg_mask (and
+    # split_mask)
+    neg_mask = ~(lb >= 0)
+    split_mask = neg_mask & ~(ub <= 0)
+    # Map each new column back to the original column (and the sign
+    # applied to it).  The first copy of every column in neg_mask is
+    # negated.
+    n_copies = 1 + split_mask
+    old_col = np.repeat(np.arange(len(lb)), n_copies)
+    col_sign = np.ones(len(old_col))
+    col_sign[(np.cumsum(n_copies) - n_copies)[neg_mask]] = -1
+    c = _gather_csc_columns(c, old_col, col_sign)
+    A = _gather_csc_columns(A, old_col, col_sign)
+    return neg_mask, split_mask, c, A
+
+
+def _gather_csc_columns(M, cols, sign):
+    """Build a new CSC matrix from (scaled) columns of an existing one"""
+    start = M.indptr[cols]
+    count = M.indptr[cols + 1] - start
+    # Columns may be gathered more than once, so the result can have
+    # more nonzeros than M
+    indptr = np.zeros(len(cols) + 1, dtype=_index_dtype(count.sum()))
+    np.cumsum(count, out=indptr[1:])
+    # Positions in M.data / M.indices of the nonzeros in each new column
+    pos = np.repeat(start - indptr[:-1], count) + np.arange(indptr[-1])
+    return _canonical_csc(
+        M.data[pos] * np.repeat(sign, count),
+        M.indices[pos],
+        indptr,
+        [M.shape[0], len(cols)],
+    )
@@ -10,13 +10,19 @@
 #  ___________________________________________________________________________
 #
 
+import gc
+
 import pyomo.common.unittest as unittest
 
 import pyomo.environ as pyo
 
 from pyomo.common.dependencies import numpy as np, scipy_available, numpy_available
 from pyomo.common.log import LoggingIntercept
-from pyomo.repn.plugins.standard_form import LinearStandardFormCompiler
+from pyomo.repn.plugins.standard_form import (
+    LinearStandardFormCompiler,
+    _ArrayBuffer,
+    _index_dtype,
+)
 
 for sol in ['glpk', 'cbc', 'gurobi', 'cplex', 'xpress']:
     linear_solver = pyo.SolverFactory(sol)
@@ -113,6 +119,100 @@ class TestLinearStandardFormCompiler(unittest.TestCase):
             "Standard Form compiler ignores export suffixes.  Skipping.\n",
         )
 
+    def test_empty_model(self):
+        m = pyo.ConcreteModel()
+        for nonnegative_vars in (False, True):
+            repn = LinearStandardFormCompiler().write(
+                m, nonnegative_vars=nonnegative_vars
+            )
+            self.assertEqual(repn.c.shape, (0, 0))
+            self.assertEqual(repn.A.shape, (0, 0))
+            self.assertEqual(repn.rhs.shape, (0,))
+            self.assertEqual(repn.c_offset.shape, (0,))
+            self.assertEqual(repn.rows, [])
+            self.assertEqual(repn.columns, [])
+            self.assertEqual(repn.eliminated_vars, [])
+
+    def test_constant_objective(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var()
+        m.o = pyo.Objective(expr=5)
+        for nonnegative_vars in (False, True):
+            repn = LinearStandardFormCompiler().write(
+                m, nonnegative_vars=nonnegative_vars
+            )
+            self.assertEqual(repn.c.shape, (1, 0))
+            self.assertEqual(repn.A.shape, (0, 0))
+            self.assertTrue(np.all(repn.c_offset == np.array([5])))
+            self.assertEqual(repn.objectives, [m.o])
+            self.assertEqual(repn.columns, [])
+            self.assertEqual(repn.eliminated_vars, [])
+
+    def test_slack_columns(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var()
+        m.y = pyo.Var()
+        m.c = pyo.Constraint(expr=m.x + m.y >= 3)
+        m.d = pyo.Constraint(expr=m.x - m.y == 1)
+        m.e = pyo.Constraint(expr=(-2, m.x, 5))
+
+        # The slack variables must remain valid after the
+        # LinearStandardFormInfo is discarded
+        columns = LinearStandardFormCompiler().write(m, slack_form=True).columns
+        gc.collect()
+        self.assertEqual(
+            [(v.name, v.bounds) for v in columns],
+            [
+                ('x', (None, None)),
+                ('y', (None, None)),
+                ('_slack_0', (None, 0)),
+                ('_slack_2', (-7, 0)),
+            ],
+        )
+
+    def test_flush_buffers(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(range(5), bounds=(-1, 4))
+        m.c = pyo.Constraint(
+            range(20),
+            rule=lambda m, i: (
+                i - 5 if i % 3 else None,
+                sum((i + j) * m.x[(i + j) % 5] for j in range(i % 4 + 1)),
+                i if i % 3 != 1 else None,
+            ),
+        )
+
+        for form in ({}, {'slack_form': True}, {'mixed_form': True}):
+            ref = LinearStandardFormCompiler().write(m, **form)
+            # Flush the row data into the NumPy buffers (and grow them)
+            # every few rows
+            with unittest.mock.patch.object(_ArrayBuffer, 'flush_size', 3):
+                repn = LinearStandardFormCompiler().write(m, **form)
+            self.assertTrue(np.all(repn.A.todense() == ref.A.todense()))
+            self.assertTrue(np.all(repn.rhs == ref.rhs))
+            self.assertEqual(repn.rows, ref.rows)
+            self.assertEqual(
+                [(v.name, v.bounds) for v in repn.columns],
+                [(v.name, v.bounds) for v in ref.columns],
+            )
+
+    def test_index_dtype(self):
+        self.assertIs(_index_dtype(0), np.int32)
+        self.assertIs(_index_dtype(2**31 - 1), np.int32)
+        self.assertIs(_index_dtype(2**31), np.int64)
+
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(bounds=(None, 0))
+        m.y = pyo.Var()
+        m.c = pyo.Constraint(expr=m.x + m.y >= 3)
+        m.o = pyo.Objective(expr=m.x)
+
+        repn = LinearStandardFormCompiler().write(m, nonnegative_vars=True)
+        self.assertEqual(repn.A.indptr.dtype, np.int32)
+        self.assertEqual(repn.c.indptr.dtype, np.int32)
+        self.assertTrue(np.all(repn.A.todense() == np.array([[1, 1, -1]])))
+        self.assertEqual([v.name for v in repn.columns], ['_neg_0', '_neg_1', '_pos_1'])
+
     def _verify_solution(self, soln, repn, eq):
         # clear out any old solution
         for v, val in soln:
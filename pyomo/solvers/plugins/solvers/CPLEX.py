@@ -15,6 +15,7 @@ import re
 import time
 import logging
 import subprocess
+from itertools import starmap
 
 from pyomo.common import Executable
 from pyomo.common.enums import maximize, minimize
@@ -135,19 +136,15 @@ class CPLEX(OptSolver):
 class ORDFileSchema(object):
     HEADER = "* ENCODING=ISO-8859-1\nNAME             Priority Order\n"
     FOOTER = "ENDATA\n"
+    _DIRECTION_STR = {BranchDirection.down: "DN", BranchDirection.up: "UP"}
 
     @classmethod
     def ROW(cls, name, priority, branch_direction=None):
         return " %s %s %s\n" % (cls._direction_to_str(branch_direction), name, priority)
 
-    @staticmethod
-    def _direction_to_str(branch_direction):
-        try:
-            return {BranchDirection.down: "DN", BranchDirection.up: "UP"}[
-                branch_direction
-            ]
-        except KeyError:
-            return ""
+    @classmethod
+    def _direction_to_str(cls, branch_direction):
+        return cls._DIRECTION_STR.get(branch_direction, "")
 
 
 @SolverFactory.register(
@@ -299,8 +296,7 @@ class CPLEXSHELL(ILMLicensedSystemCallSolver):
     def _write_priority_rows(self, rows):
         with open(self._priorities_file_name, "w") as ord_file:
             ord_file.write(ORDFileSchema.HEADER)
-            for var_name, priority, direction in rows:
-                ord_file.write(ORDFileSchema.ROW(var_name, priority, direction))
+            ord_file.writelines(starmap(ORDFileSchema.ROW, rows))
             ord_file.write(ORDFileSchema.FOOTER)
 
     # over-ride presolve to extract the warm-start keyword, if specified.